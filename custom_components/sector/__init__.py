@@ -32,4 +32,7 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: SectorAlarmConfigEntry
 ) -> bool:
     """Unload a Sector Alarm config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.api.close()
+    return unload_ok
@@ -3,15 +3,28 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import logging
+import time
+from binascii import a2b_base64
 
 import aiohttp
-import async_timeout
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .endpoints import get_action_endpoints, get_data_endpoints
+from .endpoints import get_action_endpoints, get_cache_ttl, get_data_endpoints
+
+try:
+    # orjson handles the multi-KB panel payloads several times faster than
+    # the stdlib; it ships with Home Assistant core but is not required.
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    import json
+
+    def json_dumps(obj):
+        """Serialize to UTF-8 bytes like orjson.dumps."""
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,38 +45,110 @@ class SectorAlarmAPI:
         self.password = password
         self.panel_id = panel_id
         self.access_token = None
-        self.headers = {}
         self.session = None
         self.data_endpoints = get_data_endpoints(self.panel_id)
         self.action_endpoints = get_action_endpoints()
+        # Constant URLs and the shared panel payload are built once here so
+        # the request methods do not re-format them on every call.
+        self._url_arm = self.action_endpoints["Arm"][1]
+        self._url_partial_arm = self.action_endpoints["PartialArm"][1]
+        self._url_disarm = self.action_endpoints["Disarm"][1]
+        self._url_lock = self.action_endpoints["Lock"][1]
+        self._url_unlock = self.action_endpoints["Unlock"][1]
+        self._url_login = f"{self.API_URL}/api/Login/Login"
+        self._url_logout = f"{self.API_URL}/api/Login/Logout"
+        self._url_panel_list = f"{self.API_URL}/api/account/GetPanelList"
+        self._url_lock_status = (
+            f"{self.API_URL}/api/panel/GetLockStatus?panelId={panel_id}"
+        )
+        self._url_smartplug_on = f"{self.API_URL}/api/Panel/TurnOnSmartplug"
+        self._url_smartplug_off = f"{self.API_URL}/api/Panel/TurnOffSmartplug"
+        self._url_camera_image = f"{self.API_URL}/api/camera/GetCameraImage"
+        self._base_panel_payload = {"PanelId": panel_id}
+        # Whether the API serves raw image bytes for camera snapshots;
+        # probed on first use, None until then.
+        self._camera_binary_supported: bool | None = None
+        # Responses for data endpoints are cached for a short freshness
+        # window so back-to-back polls skip the HTTPS round-trip entirely.
+        # Any state-changing action clears the cache.
+        self._cache: dict[str, tuple[float, object]] = {}
+        self._cache_ttls: dict[str, float] = {
+            url: get_cache_ttl(key)
+            for key, (_method, url) in self.data_endpoints.items()
+        }
+        # ETags seen per URL, for conditional GETs: a 304 reply carries no
+        # body, so the previously parsed value is reused.
+        self._etags: dict[str, str] = {}
+        self._last_body: dict[str, object] = {}
+        # Serializes token refresh when several in-flight requests hit 401
+        # at once; the epoch lets waiters detect that a refresh already ran.
+        self._auth_lock = asyncio.Lock()
+        self._auth_epoch = 0
+        # In-flight requests by key; concurrent callers asking for the same
+        # thing await the first request's future instead of issuing another.
+        self._inflight: dict[object, asyncio.Future] = {}
+        # Serialized request bodies by frozen payload; recurring code-free
+        # payloads are encoded to JSON exactly once. Bodies containing a
+        # panel code are deliberately never stored here.
+        self._payload_bytes: dict[tuple, bytes] = {}
+        # Polling hint for the update coordinator: grows while polls come
+        # back unchanged, resets when fresh data arrives, and honours any
+        # Retry-After the server sends when throttling.
+        self.base_interval = 60
+        self.suggested_interval = self.base_interval
+        self._poll_changed = False
+        self._poll_unchanged = False
+        self._retry_after = 0
 
     async def login(self):
         """Authenticate with the API and obtain an access token."""
-        if self.session is None:
-            self.session = async_get_clientsession(self.hass)
+        if self.session is None or self.session.closed:
+            # Dedicated session with a tuned connector: keep connections to the
+            # single Sector host alive between polls and cache DNS lookups, so
+            # repeated requests skip the TCP/TLS handshake entirely. The HA
+            # client-session helpers always wire in the shared connector, so
+            # this session is owned outright by the integration and closed
+            # again by close() on entry unload.
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+                # Any remaining json= bodies (the login call) are serialized
+                # with the same orjson-backed helper as everything else.
+                json_serialize=lambda obj: json_dumps(obj).decode(),
+                # Defaults on the owned session reach every request. aiohttp
+                # decompresses transparently; advertising gzip shrinks the
+                # JSON-heavy payloads severalfold on the wire.
+                headers={
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip, deflate",
+                    "Connection": "keep-alive",
+                },
+            )
 
-        login_url = f"{self.API_URL}/api/Login/Login"
         payload = {
             "userId": self.email,
             "password": self.password,
         }
         try:
-            async with async_timeout.timeout(10):
-                async with self.session.post(login_url, json=payload) as response:
-                    if response.status != 200:
-                        _LOGGER.error(
-                            "Login failed with status code %s", response.status
-                        )
-                        raise AuthenticationError("Invalid credentials")
-                    data = await response.json()
-                    self.access_token = data.get("AuthorizationToken")
-                    if not self.access_token:
-                        _LOGGER.error("Login failed: No access token received")
-                        raise AuthenticationError("Invalid credentials")
-                    self.headers = {
-                        "Authorization": f"Bearer {self.access_token}",
-                        "Accept": "application/json",
-                    }
+            async with self.session.post(self._url_login, json=payload) as response:
+                if response.status != 200:
+                    _LOGGER.error("Login failed with status code %s", response.status)
+                    raise AuthenticationError("Invalid credentials")
+                data = await response.json()
+                self.access_token = data.get("AuthorizationToken")
+                if not self.access_token:
+                    _LOGGER.error("Login failed: No access token received")
+                    raise AuthenticationError("Invalid credentials")
+                # The session is integration-owned, so its default headers
+                # stay mutable: carrying the bearer token there means no
+                # per-request headers dict for aiohttp to merge. Re-login
+                # simply overwrites the entry.
+                self.session.headers["Authorization"] = f"Bearer {self.access_token}"
 
         except asyncio.TimeoutError as err:
             _LOGGER.error("Timeout occurred during login")
@@ -75,9 +160,8 @@ class SectorAlarmAPI:
     async def get_panel_list(self):
         """Retrieve available panels from the API."""
         data = []
-        panellist_url = f"{self.API_URL}/api/account/GetPanelList"
-        response = await self._get(panellist_url)
-        _LOGGER.debug(f"panel_payload: {response}")
+        response = await self._get(self._url_panel_list)
+        _LOGGER.debug("panel_payload: %s", response)
         if response:
             data = [item["PanelId"] for item in response if "PanelId" in item]
         else:
@@ -90,117 +174,236 @@ class SectorAlarmAPI:
         """Retrieve all relevant data from the API."""
         data = {}
 
-        # Iterate over data endpoints
+        self._poll_changed = False
+        self._poll_unchanged = False
+        self._retry_after = 0
+
+        # Issue all endpoint requests concurrently; each one is independent,
+        # so total latency is bounded by the slowest request instead of the sum.
+        keys = []
+        tasks = []
         for key, (method, url) in self.data_endpoints.items():
             if method == "GET":
-                response = await self._get(url)
+                tasks.append(self._get(url))
             elif method == "POST":
                 # For POST requests, we need to provide the panel ID in the payload
-                payload = {"PanelId": self.panel_id}
-                response = await self._post(url, payload)
+                tasks.append(self._post(url, self._base_panel_payload))
             else:
                 _LOGGER.error("Unsupported HTTP method %s for endpoint %s", method, key)
                 continue
+            keys.append(key)
 
-            if response:
+        keys.append("Lock Status")
+        tasks.append(self.get_lock_status())
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for key, response in zip(keys, results):
+            if isinstance(response, BaseException):
+                _LOGGER.error("Error retrieving data for %s: %s", key, response)
+            elif response:
                 data[key] = response
             else:
                 _LOGGER.info("No data retrieved for %s", key)
 
-        locks_status = await self.get_lock_status()
-        data["Lock Status"] = locks_status
+        # Update the polling hint: back off while the server throttles or
+        # replies "unchanged", snap back to the base cadence on fresh data.
+        # A poll where every request failed sets neither flag and leaves the
+        # interval alone, so an outage never ratchets up the cadence.
+        if self._retry_after:
+            self.suggested_interval = max(self.suggested_interval, self._retry_after)
+        elif self._poll_changed:
+            self.suggested_interval = self.base_interval
+        elif self._poll_unchanged:
+            self.suggested_interval = min(
+                self.suggested_interval * 1.5, self.base_interval * 5
+            )
 
         return data
 
     async def get_lock_status(self):
         """Retrieve the lock status."""
-        url = f"{self.API_URL}/api/panel/GetLockStatus?panelId={self.panel_id}"
-        response = await self._get(url)
+        response = await self._get(self._url_lock_status)
         if response:
             return response
         else:
             _LOGGER.error("Failed to retrieve lock status")
             return []
 
-    async def _get(self, url):
-        """Helper method to perform GET requests with timeout."""
-        try:
-            async with async_timeout.timeout(10):
-                async with self.session.get(url, headers=self.headers) as response:
-                    if response.status == 200:
-                        content_type = response.headers.get("Content-Type", "")
-                        if "application/json" in content_type:
-                            return await response.json()
-                        else:
-                            text = await response.text()
-                            _LOGGER.error(
-                                "Received non-JSON response from %s: %s", url, text
-                            )
-                            return None
-                    else:
-                        text = await response.text()
-                        _LOGGER.error(
-                            "GET request to %s failed with status code %s, response: %s",
-                            url,
-                            response.status,
-                            text,
-                        )
-                        return None
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout occurred during GET request to %s", url)
-            return None
-        except aiohttp.ClientError as e:
-            _LOGGER.error("Client error during GET request to %s: %s", url, str(e))
+    def _cache_lookup(self, url):
+        """Return a still-fresh cached response for a data endpoint, else None."""
+        ttl = self._cache_ttls.get(url)
+        if ttl is None or url not in self._cache:
             return None
+        timestamp, value = self._cache[url]
+        if time.monotonic() - timestamp < ttl:
+            return value
+        return None
 
-    async def _post(self, url, payload):
-        """Helper method to perform POST requests with timeout."""
+    def _cache_store(self, url, value):
+        """Store a response for a data endpoint, if it is cacheable."""
+        if url in self._cache_ttls:
+            self._cache[url] = (time.monotonic(), value)
+
+    async def _request(self, method, url, payload=None):
+        """Perform an HTTP request and return the parsed JSON body, or None.
+
+        The session-wide ClientTimeout bounds the request; no extra timeout
+        wrapper is needed. Cacheable data endpoint responses are served from
+        and stored into the TTL cache, and GETs are made conditional when an
+        ETag is known for the URL.
+        """
+        cached = self._cache_lookup(url)
+        if cached is not None:
+            self._poll_unchanged = True
+            return cached
+
+        # Coalesce duplicate concurrent requests (common when many entities
+        # refresh at once): later callers wait on the first one's future.
+        if method == "GET":
+            flight_key = url
+        else:
+            flight_key = (url, tuple(sorted(payload.items())) if payload else ())
+        if (existing := self._inflight.get(flight_key)) is not None:
+            try:
+                return await asyncio.shield(existing)
+            except asyncio.CancelledError:
+                if not existing.cancelled():
+                    # We were cancelled ourselves; propagate as usual.
+                    raise
+                # The leading request was torn down (e.g. its caller timed
+                # out); issue our own request rather than inheriting its
+                # cancellation.
+                return await self._send_request(method, url, payload)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
         try:
-            async with async_timeout.timeout(10):
-                async with self.session.post(
-                    url, json=payload, headers=self.headers
+            result = await self._send_request(method, url, payload)
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(flight_key, None)
+
+    async def _send_request(self, method, url, payload=None):
+        """Send the request, refreshing the auth token once on a 401."""
+        body = None
+        if payload is not None:
+            if "PanelCode" in payload:
+                # Never retain bodies carrying a user-entered panel code;
+                # serialize them fresh and let them go out of scope.
+                body = json_dumps(payload)
+            else:
+                # Reuse the serialized bytes for the recurring code-free
+                # payloads (panel, smartplug, camera); the set of distinct
+                # bodies is bounded by the device count.
+                payload_key = tuple(sorted(payload.items()))
+                body = self._payload_bytes.get(payload_key)
+                if body is None:
+                    body = json_dumps(payload)
+                    self._payload_bytes[payload_key] = body
+        retried = False
+        while True:
+            headers = None
+            if payload is not None:
+                headers = {"Content-Type": "application/json"}
+            if method == "GET":
+                etag = self._etags.get(url)
+                if etag:
+                    headers = {"If-None-Match": etag}
+            try:
+                async with self.session.request(
+                    method, url, data=body, headers=headers
                 ) as response:
+                    if response.status == 401 and not retried:
+                        # Expired token; refresh it once and replay the request
+                        # instead of failing the whole update cycle.
+                        retried = True
+                        _LOGGER.debug(
+                            "Got 401 for %s, refreshing token and retrying", url
+                        )
+                        await self._refresh_token()
+                        continue
+                    if response.status == 304:
+                        # Unchanged on the server; reuse the last parsed body.
+                        self._poll_unchanged = True
+                        value = self._last_body.get(url)
+                        self._cache_store(url, value)
+                        return value
                     if response.status == 200:
+                        self._poll_changed = True
                         content_type = response.headers.get("Content-Type", "")
                         if "application/json" in content_type:
-                            return await response.json()
-                        else:
-                            text = await response.text()
-                            _LOGGER.error(
-                                "Received non-JSON response from %s: %s", url, text
-                            )
-                            return None
-                    else:
+                            value = json_loads(await response.read())
+                            new_etag = response.headers.get("ETag")
+                            if new_etag:
+                                self._etags[url] = new_etag
+                                self._last_body[url] = value
+                            self._cache_store(url, value)
+                            return value
                         text = await response.text()
                         _LOGGER.error(
-                            "POST request to %s failed with status code %s, response: %s",
-                            url,
-                            response.status,
-                            text,
+                            "Received non-JSON response from %s: %s", url, text
                         )
                         return None
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout occurred during POST request to %s", url)
-            return None
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Client error during POST request to %s: %s", url, str(err))
-            return None
+                    if response.status in (429, 503):
+                        retry_after = response.headers.get("Retry-After")
+                        if retry_after and retry_after.isdigit():
+                            self._retry_after = int(retry_after)
+                    text = await response.text()
+                    _LOGGER.error(
+                        "%s request to %s failed with status code %s, response: %s",
+                        method,
+                        url,
+                        response.status,
+                        text,
+                    )
+                    return None
+            except asyncio.TimeoutError:
+                _LOGGER.error("Timeout occurred during %s request to %s", method, url)
+                return None
+            except aiohttp.ClientError as err:
+                _LOGGER.error(
+                    "Client error during %s request to %s: %s", method, url, str(err)
+                )
+                return None
+            except AuthenticationError:
+                _LOGGER.error("Re-authentication failed during %s to %s", method, url)
+                return None
+
+    async def _refresh_token(self):
+        """Re-login once even when many concurrent requests hit a 401."""
+        epoch = self._auth_epoch
+        async with self._auth_lock:
+            if epoch == self._auth_epoch:
+                await self.login()
+                self._auth_epoch += 1
+
+    async def _get(self, url):
+        """Helper method to perform GET requests."""
+        return await self._request("GET", url)
+
+    async def _post(self, url, payload):
+        """Helper method to perform POST requests."""
+        # Only the data endpoints are cacheable; their payload is always the
+        # panel id, so the URL alone is a sufficient cache key.
+        return await self._request("POST", url, payload)
 
     async def arm_system(self, mode: str, code: str):
         """Arm the alarm system."""
         panel_code = code
         if mode == "total":
-            url = self.action_endpoints["Arm"][1]
+            url = self._url_arm
         elif mode == "partial":
-            url = self.action_endpoints["PartialArm"][1]
+            url = self._url_partial_arm
 
-        payload = {
-            "PanelCode": panel_code,
-            "PanelId": self.panel_id,
-        }
+        payload = {**self._base_panel_payload, "PanelCode": panel_code}
         result = await self._post(url, payload)
         if result is not None:
             _LOGGER.debug("System armed successfully")
+            self._cache.clear()
             return True
         else:
             _LOGGER.error("Failed to arm system")
@@ -209,14 +412,12 @@ class SectorAlarmAPI:
     async def disarm_system(self, code: str):
         """Disarm the alarm system."""
         panel_code = code
-        url = self.action_endpoints["Disarm"][1]
-        payload = {
-            "PanelCode": panel_code,
-            "PanelId": self.panel_id,
-        }
+        url = self._url_disarm
+        payload = {**self._base_panel_payload, "PanelCode": panel_code}
         result = await self._post(url, payload)
         if result is not None:
             _LOGGER.debug("System disarmed successfully")
+            self._cache.clear()
             return True
         else:
             _LOGGER.error("Failed to disarm system")
@@ -225,16 +426,17 @@ class SectorAlarmAPI:
     async def lock_door(self, serial_no: str, code: str):
         """Lock a specific door."""
         panel_code = code
-        url = self.action_endpoints["Lock"][1]
+        url = self._url_lock
         payload = {
+            **self._base_panel_payload,
             "LockSerial": serial_no,
             "PanelCode": panel_code,
-            "PanelId": self.panel_id,
             "SerialNo": serial_no,
         }
         result = await self._post(url, payload)
         if result is not None:
             _LOGGER.debug("Door %s locked successfully", serial_no)
+            self._cache.clear()
             return True
         else:
             _LOGGER.error("Failed to lock door %s", serial_no)
@@ -243,31 +445,43 @@ class SectorAlarmAPI:
     async def unlock_door(self, serial_no: str, code: str):
         """Unlock a specific door."""
         panel_code = code
-        url = self.action_endpoints["Unlock"][1]
+        url = self._url_unlock
         payload = {
+            **self._base_panel_payload,
             "LockSerial": serial_no,
             "PanelCode": panel_code,
-            "PanelId": self.panel_id,
             "SerialNo": serial_no,
         }
         result = await self._post(url, payload)
         if result is not None:
             _LOGGER.debug("Door %s unlocked successfully", serial_no)
+            self._cache.clear()
             return True
         else:
             _LOGGER.error("Failed to unlock door %s", serial_no)
             return False
 
+    async def lock_doors(self, serial_nos, code: str):
+        """Lock several doors concurrently over the pooled connections."""
+        return await asyncio.gather(
+            *(self.lock_door(serial_no, code) for serial_no in serial_nos),
+            return_exceptions=True,
+        )
+
+    async def unlock_doors(self, serial_nos, code: str):
+        """Unlock several doors concurrently over the pooled connections."""
+        return await asyncio.gather(
+            *(self.unlock_door(serial_no, code) for serial_no in serial_nos),
+            return_exceptions=True,
+        )
+
     async def turn_on_smartplug(self, plug_id):
         """Turn on a smart plug."""
-        url = f"{self.API_URL}/api/Panel/TurnOnSmartplug"
-        payload = {
-            "PanelId": self.panel_id,
-            "DeviceId": plug_id,
-        }
-        result = await self._post(url, payload)
+        payload = {**self._base_panel_payload, "DeviceId": plug_id}
+        result = await self._post(self._url_smartplug_on, payload)
         if result is not None:
             _LOGGER.debug("Smart plug %s turned on successfully", plug_id)
+            self._cache.clear()
             return True
         else:
             _LOGGER.error("Failed to turn on smart plug %s", plug_id)
@@ -275,34 +489,103 @@ class SectorAlarmAPI:
 
     async def turn_off_smartplug(self, plug_id):
         """Turn off a smart plug."""
-        url = f"{self.API_URL}/api/Panel/TurnOffSmartplug"
-        payload = {
-            "PanelId": self.panel_id,
-            "DeviceId": plug_id,
-        }
-        result = await self._post(url, payload)
+        payload = {**self._base_panel_payload, "DeviceId": plug_id}
+        result = await self._post(self._url_smartplug_off, payload)
         if result is not None:
             _LOGGER.debug("Smart plug %s turned off successfully", plug_id)
+            self._cache.clear()
             return True
         else:
             _LOGGER.error("Failed to turn off smart plug %s", plug_id)
             return False
 
+    async def turn_on_smartplugs(self, plug_ids):
+        """Turn on several smart plugs concurrently."""
+        return await asyncio.gather(
+            *(self.turn_on_smartplug(plug_id) for plug_id in plug_ids),
+            return_exceptions=True,
+        )
+
+    async def turn_off_smartplugs(self, plug_ids):
+        """Turn off several smart plugs concurrently."""
+        return await asyncio.gather(
+            *(self.turn_off_smartplug(plug_id) for plug_id in plug_ids),
+            return_exceptions=True,
+        )
+
+    async def _get_bytes(self, url):
+        """Helper method to fetch a raw image body.
+
+        Returns the bytes when the server answers with an image, or None
+        when it definitively does not serve one: a non-image 200, or a
+        definitive client error such as 404, 405 (GET on a POST-only
+        route) or 400. Transport errors and retryable statuses (401, 408,
+        429, 5xx) raise, so callers can tell a missing binary endpoint
+        from a transient failure.
+        """
+        async with self.session.get(url) as response:
+            content_type = response.headers.get("Content-Type", "")
+            if response.status == 200 and content_type.startswith("image/"):
+                return await response.read()
+            if response.status == 200:
+                return None
+            if 400 <= response.status < 500 and response.status not in (401, 408, 429):
+                return None
+            response.raise_for_status()
+            return None
+
     async def get_camera_image(self, serial_no):
         """Retrieve the latest image from a camera."""
-        url = f"{self.API_URL}/api/camera/GetCameraImage"
-        payload = {
-            "PanelId": self.panel_id,
-            "SerialNo": serial_no,
-        }
-        response = await self._post(url, payload)
+        # A binary snapshot avoids the ~33% base64 inflation on the wire and
+        # the JSON parse + base64 decode of the largest payload in the client.
+        # Probe once; if the API only speaks JSON, remember and skip the probe.
+        if self._camera_binary_supported is not False:
+            try:
+                image_data = await self._get_bytes(
+                    f"{self._url_camera_image}?panelId={self.panel_id}&serialNo={serial_no}"
+                )
+            except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+                # Transient failure: leave the probe undecided so the binary
+                # path gets another chance, and fall back to JSON for now.
+                _LOGGER.debug(
+                    "Binary snapshot attempt for camera %s failed: %s", serial_no, err
+                )
+            else:
+                if image_data is not None:
+                    self._camera_binary_supported = True
+                    return image_data
+                # Definitive answer: the API does not serve raw images.
+                self._camera_binary_supported = False
+
+        payload = {**self._base_panel_payload, "SerialNo": serial_no}
+        response = await self._post(self._url_camera_image, payload)
         if response and response.get("ImageData"):
-            image_data = base64.b64decode(response["ImageData"])
+            # Decoding a multi-MB blob is CPU-bound; run it in the executor
+            # so entity updates on the event loop are not stalled.
+            image_data = await self.hass.async_add_executor_job(
+                a2b_base64, response["ImageData"]
+            )
             return image_data
         _LOGGER.error("Failed to retrieve image for camera %s", serial_no)
         return None
 
     async def logout(self):
-        """Logout from the API."""
-        logout_url = f"{self.API_URL}/api/Login/Logout"
-        await self._post(logout_url, {})
+        """Logout from the API, best effort.
+
+        The server-side logout is a courtesy: it is skipped when there is no
+        live session or token, bounded by a short timeout so a dead network
+        cannot stall shutdown, and any failure is swallowed. The session
+        itself is closed separately via close() on entry unload.
+        """
+        if self.access_token and self.session and not self.session.closed:
+            try:
+                await asyncio.wait_for(self._post(self._url_logout, {}), timeout=2)
+            except Exception:  # noqa: BLE001
+                _LOGGER.debug("Logout request failed; continuing shutdown")
+        self.access_token = None
+
+    async def close(self):
+        """Close the integration-owned client session."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
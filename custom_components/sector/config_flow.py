@@ -55,7 +55,7 @@ class SectorAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
                 # Since panel_list is a list, we directly assign it to self.panel_ids
                 self.panel_ids = panel_list
-                _LOGGER.error(f"panel_ids: {self.panel_ids}")
+                _LOGGER.debug("panel_ids: %s", self.panel_ids)
                 if not self.panel_ids:
                     errors["base"] = "no_panels_found"
                 elif len(self.panel_ids) == 1:
@@ -80,6 +80,10 @@ class SectorAlarmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception as e:
                 errors["base"] = "unknown_error"
                 _LOGGER.exception("Unexpected exception during authentication: %s", e)
+            finally:
+                # The validation client owns its session; close it on every
+                # path so config-flow attempts do not leak connections.
+                await api.close()
 
         data_schema = vol.Schema(
             {
@@ -55,6 +55,17 @@ class SectorDataUpdateCoordinator(DataUpdateCoordinator):
             await self.api.login()
             api_data = await self.api.retrieve_all_data()
 
+            # Follow the client's polling hint: it backs off while the API
+            # throttles or nothing changes and returns to the base cadence
+            # as soon as fresh data arrives.
+            suggested = timedelta(seconds=self.api.suggested_interval)
+            if self.update_interval != suggested:
+                _LOGGER.debug(
+                    "Adjusting update interval to %s seconds",
+                    self.api.suggested_interval,
+                )
+                self.update_interval = suggested
+
             for key, value in api_data.items():
                 if isinstance(value, dict) and key not in ["Lock Status", "Logs"]:
                     data[key] = value
@@ -2,6 +2,29 @@
 
 API_URL = "https://mypagesapi.sectoralarm.net"
 
+# Freshness window in seconds for cached data endpoint responses.
+# Live status endpoints get short windows; device inventories rarely
+# change between polls and can be held longer.
+DEFAULT_CACHE_TTL = 15
+DATA_ENDPOINT_TTLS = {
+    "Humidity": 30,
+    "Doors and Windows": 15,
+    "Leakage Detectors": 30,
+    "Smoke Detectors": 30,
+    "Cameras": 30,
+    "Persons": 30,
+    "Temperatures": 30,
+    "Panel Status": 5,
+    "Smartplug Status": 5,
+    "Lock Status": 5,
+    "Logs": 15,
+}
+
+
+def get_cache_ttl(key):
+    """Return the cache TTL in seconds for a data endpoint key."""
+    return DATA_ENDPOINT_TTLS.get(key, DEFAULT_CACHE_TTL)
+
 
 def get_data_endpoints(panel_id):
     """Return a dictionary of data retrieval endpoints."""